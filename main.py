@@ -8,8 +8,11 @@ import httpx
 import re
 import os
 import csv
+import heapq
 import json
 
+from update_startup_database import DEFAULT_STATUS
+
 app = FastAPI(
     title="Startup Tracker API",
     description="Track trending and failed startups daily",
@@ -44,8 +47,9 @@ class Startup(BaseModel):
     social_links: Optional[dict] = None
     date_added: str
     source: str
-    status: str  # "trending" or "failed"
-    reason: Optional[str] = None  # For failed startups
+    status: str  # "trending", "failed" or "acquired"
+    reason: Optional[str] = None  # For failed/acquired startups
+    shutdown_date: Optional[str] = None  # For failed/acquired startups
 
 class DashboardData(BaseModel):
     trending_startups: List[Startup]
@@ -54,6 +58,9 @@ class DashboardData(BaseModel):
     total_trending: int
     total_failed: int
 
+# Statuses listed in the failed column of the dashboard
+FAILED_STATUSES = ("failed", "acquired")
+
 # In-memory storage
 trending_startups_data = []
 failed_startups_data = []
@@ -270,7 +277,7 @@ SAMPLE_FAILED = [
         "website": "https://techcrunch.com/2026/02/09/uber-to-buy-delivery-arm-of-turkeys-getir/",
         "date_added": "2026-02-09",
         "source": "TechCrunch",
-        "status": "failed",
+        "status": "acquired",
         "reason": "Acquired by Uber - delivery arm sold off after struggling with profitability"
     },
     {
@@ -324,53 +331,86 @@ SAMPLE_FAILED = [
     }
 ]
 
+def row_to_startup(row: dict, status: str) -> dict:
+    """Convert a CSV database row into a startup dict"""
+    # Parse founders
+    founders_list = []
+    if row.get('founders') and row['founders'] != 'nan':
+        for founder_name in row['founders'].split(', '):
+            if founder_name.strip():
+                founders_list.append({
+                    "name": founder_name.strip(),
+                    "email": None,
+                    "linkedin": None,
+                    "role": "Founder"
+                })
+    
+    shutdown_date = row.get('shutdown_date') or None
+    
+    return {
+        "name": row['startup_name'],
+        "description": row.get('description', '')[:300] or f"Innovative startup in {row.get('industry', 'technology')}",
+        "funding_amount": row.get('funding_amount', ''),
+        "founders": founders_list,
+        "location": row.get('location', ''),
+        "industry": row.get('industry', ''),
+        "website": row.get('website', ''),
+        "date_added": shutdown_date or "2026-02-12",
+        "source": row.get('source', 'topstartups.io'),
+        "status": status,
+        "reason": row.get('reason') or None,
+        "shutdown_date": shutdown_date
+    }
+
+def row_status(row: dict) -> str:
+    """Normalized status of a CSV database row"""
+    return (row.get('status') or '').strip().lower() or DEFAULT_STATUS
+
+def shutdown_key(row: dict) -> str:
+    """Sort key for ordering rows by shutdown date"""
+    return row.get('shutdown_date') or ''
+
+def index_by_status(reader) -> dict:
+    """Partition raw database rows by status in a single pass, newest shutdowns first"""
+    by_status = {}
+    
+    for row in reader:
+        by_status.setdefault(row_status(row), []).append(row)
+    
+    # Stable sort, so rows without a shutdown date keep their file order
+    for rows in by_status.values():
+        rows.sort(key=shutdown_key, reverse=True)
+    
+    return by_status
+
 def load_from_database():
-    """Load data from CSV database"""
+    """Load trending and failed startups from CSV database"""
     csv_path = os.getenv('STARTUP_DATABASE_PATH', 'data/founder_contact_database.csv')
     
-    trending = []
-    failed = []
-    
     try:
         if os.path.exists(csv_path):
             with open(csv_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    # Parse founders
-                    founders_list = []
-                    if row.get('founders') and row['founders'] != 'nan':
-                        for founder_name in row['founders'].split(', '):
-                            if founder_name.strip():
-                                founders_list.append({
-                                    "name": founder_name.strip(),
-                                    "email": None,
-                                    "linkedin": None,
-                                    "role": "Founder"
-                                })
-                    
-                    # Create startup object
-                    startup_data = {
-                        "name": row['startup_name'],
-                        "description": row.get('description', '')[:300] or f"Innovative startup in {row.get('industry', 'technology')}",
-                        "funding_amount": row.get('funding_amount', ''),
-                        "founders": founders_list,
-                        "location": row.get('location', ''),
-                        "industry": row.get('industry', ''),
-                        "website": row.get('website', ''),
-                        "date_added": "2026-02-12",
-                        "source": row.get('source', 'topstartups.io'),
-                        "status": "trending"
-                    }
-                    
-                    # Add to trending if has funding
-                    if startup_data['funding_amount']:
-                        trending.append(startup_data)
-                    
-                    # Limit to 20 trending
+                by_status = index_by_status(csv.DictReader(f))
+            
+            # Limit to 20 funded trending startups
+            trending = []
+            for row in by_status.get(DEFAULT_STATUS, []):
+                if row.get('funding_amount'):
+                    trending.append(row_to_startup(row, DEFAULT_STATUS))
                     if len(trending) >= 20:
                         break
             
-            print(f"✓ Loaded {len(trending)} startups from database")
+            # Each status list is already ordered by shutdown date
+            failed = [
+                row_to_startup(row, row_status(row))
+                for row in heapq.merge(
+                    *(by_status.get(status, []) for status in FAILED_STATUSES),
+                    key=shutdown_key,
+                    reverse=True
+                )
+            ]
+            
+            print(f"✓ Loaded {len(trending)} trending and {len(failed)} failed startups from database")
         else:
             print("⚠ Database not found, using sample data")
             return [Startup(**s) for s in SAMPLE_TRENDING], [Startup(**s) for s in SAMPLE_FAILED]
@@ -379,9 +419,6 @@ def load_from_database():
         print(f"⚠ Error loading database: {e}, using sample data")
         return [Startup(**s) for s in SAMPLE_TRENDING], [Startup(**s) for s in SAMPLE_FAILED]
     
-    # Use sample failed startups
-    failed = [s for s in SAMPLE_FAILED]
-    
     return [Startup(**s) for s in trending], [Startup(**s) for s in failed]
 
 def init_sample_data():
@@ -0,0 +1,65 @@
+import csv
+import os
+
+import update_startup_database as updater
+
+
+DATABASE = os.path.join(os.path.dirname(__file__), 'data', 'founder_contact_database.csv')
+
+TRICKY_CSV = (
+    'startup_name,description,source\r\n'
+    'Alpha,"Line one\r\nline ""two""\r\n\r\nline three",topstartups.io\r\n'
+    'Beta,plain,Y Combinator\r\n'
+    'Gamma,"""quoted"" start, and\nnewline",topstartups.io\r\n'
+    'Delta,"ends with newline\n",Y Combinator\r\n'
+    'Epsilon,no trailing newline,topstartups.io'
+)
+
+
+def reference_summary(path):
+    with open(path, 'r', newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    return {row['startup_name'].strip().lower() for row in rows}, len(rows)
+
+
+def test_scan_matches_dictreader_serial_and_parallel(monkeypatch):
+    names, total = reference_summary(DATABASE)
+    serial = updater.scan_database(DATABASE, workers=1)
+
+    monkeypatch.setattr(updater, 'PARALLEL_MIN_BYTES', 0)
+    parallel = updater.scan_database(DATABASE, workers=3)
+
+    for summary in (serial, parallel):
+        assert summary['names'] == names
+        assert summary['total'] == total
+    assert parallel['by_source'] == serial['by_source']
+    assert parallel['by_status'] == serial['by_status']
+    assert parallel['head'] == serial['head']
+
+
+def test_parallel_scan_handles_quoted_multiline_records(tmp_path, monkeypatch):
+    path = tmp_path / 'tricky.csv'
+    path.write_bytes(TRICKY_CSV.encode('utf-8'))
+    monkeypatch.setattr(updater, 'PARALLEL_MIN_BYTES', 0)
+
+    expected = updater.scan_database(str(path), workers=1)
+    assert expected['total'] == 5
+
+    # Enough workers that most offsets land inside quoted text
+    for workers in range(2, 12):
+        assert updater.scan_database(str(path), workers=workers) == expected
+
+
+def test_save_keeps_existing_rows_byte_for_byte(tmp_path):
+    path = tmp_path / 'db.csv'
+    original = open(DATABASE, 'rb').read()
+    path.write_bytes(original)
+
+    existing, added = updater.merge_with_existing(
+        [{'startup_name': 'Brand New Co', 'source': 'Y Combinator'}], str(path)
+    )
+    updater.save_database(existing, added, str(path), str(tmp_path / 'db.md'))
+
+    saved = path.read_bytes()
+    assert saved.startswith(original)
+    assert updater.scan_database(str(path))['total'] == existing['total'] + 1
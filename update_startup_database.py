@@ -9,14 +9,190 @@ Run this script daily to keep the database fresh.
 
 import json
 import csv
+import io
+import math
+import mmap
 import re
 import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Tuple
 import httpx
 from bs4 import BeautifulSoup
 
 
+FIELDNAMES = ['startup_name', 'description', 'funding_amount', 'industry',
+              'location', 'employees', 'website', 'founders',
+              'founder_emails', 'founder_linkedin', 'source', 'batch',
+              'status', 'reason', 'shutdown_date']
+
+# Rows without a status are newly funded startups
+DEFAULT_STATUS = 'trending'
+
+# Files smaller than this are scanned in-process: the pool costs ~35ms to
+# start, which only pays off from ~4MB of CSV with two or more cores
+PARALLEL_MIN_BYTES = 4 * 1024 * 1024
+
+# Rows listed under "Recent Additions" in the Markdown summary
+HEAD_ROWS = 20
+
+
+def get_worker_count() -> int:
+    """
+    Number of scanner processes, from UPDATER_WORKERS or the CPU count
+    
+    Returns:
+        Positive worker count
+    """
+    try:
+        workers = int(os.getenv('UPDATER_WORKERS', ''))
+    except ValueError:
+        workers = 0
+    
+    if workers < 1:
+        workers = os.cpu_count() or 1
+    
+    return workers
+
+
+def find_record_start(data, offset: int) -> int:
+    """
+    Find the first CSV record boundary at or after a byte offset
+    
+    Descriptions contain quoted multi-line text, so a newline only ends a
+    record when the number of quote characters before it is even.
+    
+    Args:
+        data: Memory-mapped CSV file
+        offset: Byte offset to start from (after the header)
+        
+    Returns:
+        Byte offset of the next record start, or the file size
+    """
+    quotes = data[:offset].count(b'"')
+    
+    while offset < len(data):
+        if data[offset - 1] == ord('\n') and quotes % 2 == 0:
+            return offset
+        
+        newline = data.find(b'\n', offset)
+        if newline == -1:
+            break
+        
+        quotes += data[offset:newline + 1].count(b'"')
+        offset = newline + 1
+    
+    return len(data)
+
+
+def summarize_rows(rows) -> Dict:
+    """
+    Collect what the merge and Markdown summary need from CSV rows
+    
+    Args:
+        rows: Iterable of startup dictionaries
+        
+    Returns:
+        Dictionary with names, total, by_source, by_status and head rows
+    """
+    names = []
+    by_source = {}
+    by_status = {}
+    head = []
+    
+    for row in rows:
+        names.append(row['startup_name'].strip().lower())
+        source = row.get('source', 'Unknown')
+        by_source[source] = by_source.get(source, 0) + 1
+        status = (row.get('status') or '').strip().lower() or DEFAULT_STATUS
+        by_status[status] = by_status.get(status, 0) + 1
+        if len(head) < HEAD_ROWS:
+            head.append(row)
+    
+    return {
+        'names': names,
+        'total': len(names),
+        'by_source': by_source,
+        'by_status': by_status,
+        'head': head,
+    }
+
+
+def summarize_csv_chunk(args) -> Dict:
+    """
+    Summarize the records in one byte range of the CSV (runs in a worker process)
+    
+    Args:
+        args: Tuple of (CSV path, header fieldnames, start offset, end offset)
+        
+    Returns:
+        Summary dictionary for the records starting inside the range
+    """
+    csv_path, fieldnames, start, end = args
+    
+    with open(csv_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            start = find_record_start(data, start)
+            end = find_record_start(data, end)
+            chunk = data[start:end].decode('utf-8')
+    
+    return summarize_rows(csv.DictReader(io.StringIO(chunk, newline=''), fieldnames=fieldnames))
+
+
+def scan_database(csv_path: str, workers: int = 1) -> Dict:
+    """
+    Summarize the CSV database, scanning byte ranges in parallel for large files
+    
+    Args:
+        csv_path: Path to existing CSV database
+        workers: Number of worker processes
+        
+    Returns:
+        Summary dictionary with fieldnames, names (lowercased set), total,
+        by_source, by_status and head rows
+    """
+    size = os.path.getsize(csv_path)
+    
+    if workers <= 1 or size < PARALLEL_MIN_BYTES:
+        with open(csv_path, 'r', newline='', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            summary = summarize_rows(reader)
+            summary['fieldnames'] = reader.fieldnames or []
+        summary['names'] = set(summary['names'])
+        return summary
+    
+    with open(csv_path, 'rb') as f:
+        header = f.readline()
+    fieldnames = next(csv.reader([header.decode('utf-8')]), [])
+    
+    # The parent only picks byte offsets; workers find the record boundaries
+    step = math.ceil((size - len(header)) / workers)
+    tasks = [
+        (csv_path, fieldnames, offset, min(offset + step, size))
+        for offset in range(len(header), size, step)
+    ]
+    
+    summary = {
+        'fieldnames': fieldnames,
+        'names': set(),
+        'total': 0,
+        'by_source': {},
+        'by_status': {},
+        'head': [],
+    }
+    
+    with ProcessPoolExecutor(max_workers=len(tasks)) as pool:
+        for part in pool.map(summarize_csv_chunk, tasks):
+            summary['names'].update(part['names'])
+            summary['total'] += part['total']
+            for key in ('by_source', 'by_status'):
+                for value, count in part[key].items():
+                    summary[key][value] = summary[key].get(value, 0) + count
+            summary['head'].extend(part['head'][:HEAD_ROWS - len(summary['head'])])
+    
+    return summary
+
+
 def fetch_topstartups(limit: int = 100) -> List[Dict]:
     """
     Scrape topstartups.io for latest startup data
@@ -74,101 +250,145 @@ def fetch_yc_latest_batch() -> List[Dict]:
     return startups
 
 
-def merge_with_existing(new_startups: List[Dict], csv_path: str) -> List[Dict]:
+def merge_with_existing(new_startups: List[Dict], csv_path: str, workers: int = 1) -> Tuple[Dict, List[Dict]]:
     """
     Merge new startups with existing database, avoiding duplicates
     
     Args:
         new_startups: List of new startup data
         csv_path: Path to existing CSV database
+        workers: Number of processes used to scan the database
         
     Returns:
-        Combined list with duplicates removed
+        Tuple of (existing database summary, new startups to add)
     """
     print(f"\n[3/3] Merging with existing database...")
     
-    existing = []
-    existing_names = set()
+    existing = {
+        'fieldnames': [],
+        'names': set(),
+        'total': 0,
+        'by_source': {},
+        'by_status': {},
+        'head': [],
+    }
     
     # Load existing data
     if os.path.exists(csv_path):
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                existing.append(row)
-                existing_names.add(row['startup_name'].lower())
+        existing = scan_database(csv_path, workers=workers)
         
-        print(f"✓ Loaded {len(existing)} existing startups")
+        print(f"✓ Loaded {existing['total']} existing startups")
     
     # Add new startups (avoid duplicates)
-    added = 0
+    existing_names = set(existing['names'])
+    added = []
     for startup in new_startups:
         if startup['startup_name'].lower() not in existing_names:
-            existing.append(startup)
+            startup.setdefault('status', DEFAULT_STATUS)
+            added.append(startup)
             existing_names.add(startup['startup_name'].lower())
-            added += 1
     
-    print(f"✓ Added {added} new startups")
-    print(f"✓ Total database size: {len(existing)} startups")
+    print(f"✓ Added {len(added)} new startups")
+    print(f"✓ Total database size: {existing['total'] + len(added)} startups")
     
-    return existing
+    return existing, added
 
 
-def save_database(startups: List[Dict], csv_path: str, md_path: str):
+def save_database(existing: Dict, added: List[Dict], csv_path: str, md_path: str):
     """
     Save updated database to CSV and Markdown formats
     
     Args:
-        startups: List of all startups
+        existing: Summary of the existing database from merge_with_existing
+        added: New startups to add
         csv_path: Path to save CSV file
         md_path: Path to save Markdown file
     """
-    # Save CSV
-    fieldnames = ['startup_name', 'description', 'funding_amount', 'industry', 
-                  'location', 'employees', 'website', 'founders', 
-                  'founder_emails', 'founder_linkedin', 'source', 'batch']
+    buffer = io.StringIO(newline='')
     
-    with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
+    if existing['fieldnames'] == FIELDNAMES:
+        # Existing rows are unchanged, so only the new ones are appended
+        with open(csv_path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b'\n':
+                buffer.write('\r\n')
+        
+        writer = csv.DictWriter(buffer, fieldnames=FIELDNAMES, restval='')
+        writer.writerows(added)
+        
+        with open(csv_path, 'a', newline='', encoding='utf-8') as f:
+            f.write(buffer.getvalue())
+    else:
+        # New or outdated header: rewrite the file, keeping unknown columns
+        fieldnames = FIELDNAMES + [c for c in existing['fieldnames'] if c not in FIELDNAMES]
+        rows = []
+        if os.path.exists(csv_path):
+            with open(csv_path, 'r', newline='', encoding='utf-8') as f:
+                rows = list(csv.DictReader(f))
+        
+        # Rows from before the status column are trending startups
+        for row in rows:
+            row['status'] = (row.get('status') or '').strip().lower() or DEFAULT_STATUS
+        
+        writer = csv.DictWriter(buffer, fieldnames=fieldnames, restval='')
         writer.writeheader()
-        writer.writerows(startups)
+        writer.writerows(rows)
+        writer.writerows(added)
+        
+        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+            f.write(buffer.getvalue())
     
     print(f"✓ Saved CSV to {csv_path}")
     
+    new = summarize_rows(added)
+    head = (existing['head'] + added)[:HEAD_ROWS]
+    
     # Save Markdown summary
+    parts = [
+        "# Founder Contact Database\n\n",
+        f"**Last Updated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+        f"**Total Startups:** {existing['total'] + new['total']}\n\n",
+        "---\n\n",
+    ]
+    
+    # Group by source and status
+    by_source = dict(existing['by_source'])
+    by_status = dict(existing['by_status'])
+    for source, count in new['by_source'].items():
+        by_source[source] = by_source.get(source, 0) + count
+    for status, count in new['by_status'].items():
+        by_status[status] = by_status.get(status, 0) + count
+    
+    parts.append("## Summary by Source\n\n")
+    for source, count in sorted(by_source.items(), key=lambda x: x[1], reverse=True):
+        parts.append(f"- **{source}:** {count} startups\n")
+    
+    parts.append("\n## Summary by Status\n\n")
+    for status, count in sorted(by_status.items(), key=lambda x: x[1], reverse=True):
+        parts.append(f"- **{status}:** {count} startups\n")
+    
+    parts.append("\n---\n\n")
+    parts.append("## Recent Additions (Top 20)\n\n")
+    
+    for i, startup in enumerate(head, 1):
+        parts.append(f"### {i}. {startup['startup_name']}\n\n")
+        if startup.get('description'):
+            parts.append(f"**Description:** {startup['description'][:200]}...\n\n")
+        if startup.get('founders'):
+            parts.append(f"**Founders:** {startup['founders']}\n\n")
+        if startup.get('funding_amount'):
+            parts.append(f"**Funding:** {startup['funding_amount']}\n\n")
+        if startup.get('industry'):
+            parts.append(f"**Industry:** {startup['industry']}\n\n")
+        if startup.get('website'):
+            parts.append(f"**Website:** {startup['website']}\n\n")
+        if startup.get('reason'):
+            parts.append(f"**{(startup.get('status') or DEFAULT_STATUS).title()}:** {startup['reason']}\n\n")
+        parts.append(f"**Source:** {startup['source']}\n\n")
+        parts.append("---\n\n")
+    
     with open(md_path, 'w', encoding='utf-8') as f:
-        f.write("# Founder Contact Database\n\n")
-        f.write(f"**Last Updated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-        f.write(f"**Total Startups:** {len(startups)}\n\n")
-        f.write("---\n\n")
-        
-        # Group by source
-        by_source = {}
-        for s in startups:
-            source = s.get('source', 'Unknown')
-            by_source[source] = by_source.get(source, 0) + 1
-        
-        f.write("## Summary by Source\n\n")
-        for source, count in sorted(by_source.items(), key=lambda x: x[1], reverse=True):
-            f.write(f"- **{source}:** {count} startups\n")
-        
-        f.write("\n---\n\n")
-        f.write("## Recent Additions (Top 20)\n\n")
-        
-        for i, startup in enumerate(startups[:20], 1):
-            f.write(f"### {i}. {startup['startup_name']}\n\n")
-            if startup.get('description'):
-                f.write(f"**Description:** {startup['description'][:200]}...\n\n")
-            if startup.get('founders'):
-                f.write(f"**Founders:** {startup['founders']}\n\n")
-            if startup.get('funding_amount'):
-                f.write(f"**Funding:** {startup['funding_amount']}\n\n")
-            if startup.get('industry'):
-                f.write(f"**Industry:** {startup['industry']}\n\n")
-            if startup.get('website'):
-                f.write(f"**Website:** {startup['website']}\n\n")
-            f.write(f"**Source:** {startup['source']}\n\n")
-            f.write("---\n\n")
+        f.write(''.join(parts))
     
     print(f"✓ Saved Markdown to {md_path}")
 
@@ -198,17 +418,17 @@ def main():
         return
     
     # Merge with existing
-    all_startups = merge_with_existing(new_startups, csv_path)
+    existing, added = merge_with_existing(new_startups, csv_path, workers=get_worker_count())
     
     # Save updated database
-    save_database(all_startups, csv_path, md_path)
+    save_database(existing, added, csv_path, md_path)
     
     print("\n" + "="*60)
     print("✓ UPDATE COMPLETE")
     print("="*60)
     print(f"Finished at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"\nDatabase location: {csv_path}")
-    print(f"Total startups: {len(all_startups)}")
+    print(f"Total startups: {existing['total'] + len(added)}")
 
 
 if __name__ == "__main__":